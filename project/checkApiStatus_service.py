@@ -1,6 +1,17 @@
-from httpx import AsyncClient
+import asyncio
+import time
+from typing import Optional, Tuple
+
 from pydantic import BaseModel
 
+import project.http_client
+
+_STATUS_URL = "https://console.groq.com/api/status"
+_PROBE_INTERVAL = 15.0
+_STALE_AFTER = 60.0
+
+_last_status: Optional[Tuple[int, str, float]] = None
+
 
 class GetApiStatusRequest(BaseModel):
     """
@@ -19,6 +30,43 @@ class GetApiStatusResponse(BaseModel):
     message: str
 
 
+async def _probe_once() -> None:
+    """
+    Performs one live GET against the GROQ status endpoint and caches the result.
+    """
+    global _last_status
+    try:
+        response = await project.http_client.client.get(_STATUS_URL)
+        status_code = response.status_code
+        if status_code == 200:
+            message = "API is operational."
+        else:
+            message = "API is experiencing issues."
+        _last_status = (status_code, message, time.monotonic())
+    except Exception as e:
+        _last_status = (503, str(e), time.monotonic())
+
+
+async def _probe_loop() -> None:
+    """
+    Background task that refreshes the cached GROQ status every few seconds.
+    """
+    while True:
+        await _probe_once()
+        await asyncio.sleep(_PROBE_INTERVAL)
+
+
+def start_probe() -> "asyncio.Task[None]":
+    """
+    Starts the background status probe. Called from the application lifespan;
+    the returned task should be cancelled on shutdown.
+
+    Returns:
+        asyncio.Task[None]: The running probe task.
+    """
+    return asyncio.create_task(_probe_loop())
+
+
 async def checkApiStatus(request: GetApiStatusRequest) -> GetApiStatusResponse:
     """
     This endpoint provides the current status of the emoji-explainer API. It helps in monitoring whether the API is up and running and can connect to external services like GROQ. The endpoint would simply return a status code and a message indicating the API's health.
@@ -34,15 +82,11 @@ async def checkApiStatus(request: GetApiStatusRequest) -> GetApiStatusResponse:
         response = await checkApiStatus(request)
         print(response.status_code, response.message)
     """
-    url = "https://console.groq.com/api/status"
-    async with AsyncClient() as client:
-        try:
-            response = await client.get(url)
-            status_code = response.status_code
-            if status_code == 200:
-                message = "API is operational."
-            else:
-                message = "API is experiencing issues."
-            return GetApiStatusResponse(status_code=status_code, message=message)
-        except Exception as e:
-            return GetApiStatusResponse(status_code=503, message=str(e))
+    if _last_status is None:
+        await _probe_once()
+    status_code, message, probed_at = _last_status
+    if time.monotonic() - probed_at > _STALE_AFTER:
+        return GetApiStatusResponse(
+            status_code=503, message="API status is stale; last probe is too old."
+        )
+    return GetApiStatusResponse(status_code=status_code, message=message)
@@ -0,0 +1,46 @@
+import os
+from typing import Optional
+
+from prisma import Prisma
+
+_DEFAULT_CONNECTION_LIMIT = "20"
+_DEFAULT_POOL_TIMEOUT = "10"
+
+
+def _datasource() -> Optional[dict]:
+    """
+    Builds the datasource override for the shared client, appending explicit
+    connection-pool settings to DATABASE_URL unless the URL already sets them.
+
+    Returns:
+        Optional[dict]: A datasource dict for Prisma, or None when
+        DATABASE_URL is unset and Prisma should fall back to the schema env.
+    """
+    url = os.getenv("DATABASE_URL")
+    if url is None:
+        return None
+    if "connection_limit" not in url:
+        separator = "&" if "?" in url else "?"
+        limit = os.getenv("DB_CONNECTION_LIMIT", _DEFAULT_CONNECTION_LIMIT)
+        timeout = os.getenv("DB_POOL_TIMEOUT", _DEFAULT_POOL_TIMEOUT)
+        url = f"{url}{separator}connection_limit={limit}&pool_timeout={timeout}"
+    return {"url": url}
+
+
+db: Prisma = Prisma(auto_register=True, datasource=_datasource())
+"""Single Prisma client shared by the whole application.
+
+auto_register makes this instance the client behind every
+``prisma.models.X.prisma()`` call in the service modules, so all queries run
+through one connection pool sized via DB_CONNECTION_LIMIT/DB_POOL_TIMEOUT
+(or an explicit connection_limit in DATABASE_URL). project.server connects it
+at startup, runs a warmup query, and disconnects at shutdown.
+"""
+
+
+async def warmup() -> None:
+    """
+    Issues a trivial query after connect so the pool is established before the
+    first real request instead of paying the cold-connection cost there.
+    """
+    await db.user.count()
@@ -22,6 +22,13 @@ async def deleteFeedback(feedbackId: int) -> DeleteFeedbackResponse:
     Returns:
         DeleteFeedbackResponse: This model defines the structure of the response after attempting to delete a feedback. It will confirm whether the deletion was successful.
     """
+    deleted_count = await prisma.models.Feedback.prisma().delete_many(
+        where={"id": feedbackId, "reviewed": False}
+    )
+    if deleted_count:
+        return DeleteFeedbackResponse(
+            success=True, message=f"Feedback {feedbackId} successfully deleted."
+        )
     feedback = await prisma.models.Feedback.prisma().find_unique(
         where={"id": feedbackId}
     )
@@ -29,19 +36,7 @@ async def deleteFeedback(feedbackId: int) -> DeleteFeedbackResponse:
         return DeleteFeedbackResponse(
             success=False, message=f"No feedback found with ID {feedbackId}"
         )
-    if feedback.reviewed:
-        return DeleteFeedbackResponse(
-            success=False,
-            message=f"Feedback {feedbackId} has been reviewed and cannot be deleted",
-        )
-    delete_result = await prisma.models.Feedback.prisma().delete(
-        where={"id": feedbackId}
+    return DeleteFeedbackResponse(
+        success=False,
+        message=f"Feedback {feedbackId} has been reviewed and cannot be deleted",
     )
-    if delete_result:
-        return DeleteFeedbackResponse(
-            success=True, message=f"Feedback {feedbackId} successfully deleted."
-        )
-    else:
-        return DeleteFeedbackResponse(
-            success=False, message="Deletion failed due to a server error."
-        )
@@ -23,13 +23,19 @@ async def deleteUser(userId: str) -> DeleteUserResponse:
     Returns:
         DeleteUserResponse: This communicates the successful deletion of a user or failure thereof, without disclosing sensitive user information.
     """
-    user = await prisma.models.User.prisma().find_unique(where={"id": int(userId)})
+    try:
+        user_id = int(userId)
+    except ValueError:
+        return DeleteUserResponse(message="Invalid user ID.", status=400)
+    deleted_count = await prisma.models.User.prisma().delete_many(
+        where={"id": user_id, "role": prisma.enums.Role.ADMIN}
+    )
+    if deleted_count:
+        return DeleteUserResponse(message="User successfully deleted.", status=200)
+    user = await prisma.models.User.prisma().find_unique(where={"id": user_id})
     if not user:
         return DeleteUserResponse(message="User not found.", status=404)
-    if user.role != prisma.enums.Role.ADMIN:
-        return DeleteUserResponse(
-            message="Unauthorized access. Only admin users can delete accounts.",
-            status=403,
-        )
-    await prisma.models.User.prisma().delete(where={"id": int(userId)})
-    return DeleteUserResponse(message="User successfully deleted.", status=200)
+    return DeleteUserResponse(
+        message="Unauthorized access. Only admin users can delete accounts.",
+        status=403,
+    )
@@ -0,0 +1,111 @@
+import asyncio
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Optional
+
+_MAX_SIZE = 4096
+
+_cache: "OrderedDict[str, str]" = OrderedDict()
+
+_inflight: Dict[str, "asyncio.Future[str]"] = {}
+
+
+def _key(emoji: str) -> str:
+    """
+    NFC-normalizes an emoji so visually identical codepoint sequences share
+    one cache entry and one in-flight lookup.
+
+    Args:
+        emoji (str): The raw emoji character.
+
+    Returns:
+        str: The normalized cache key.
+    """
+    return unicodedata.normalize("NFC", emoji)
+
+
+def get(emoji: str) -> Optional[str]:
+    """
+    Returns the cached meaning for an emoji, or None on a miss.
+
+    Args:
+        emoji (str): The emoji character used as the cache key.
+
+    Returns:
+        Optional[str]: The cached meaning, or None if the emoji has not been seen.
+    """
+    key = _key(emoji)
+    meaning = _cache.get(key)
+    if meaning is not None:
+        _cache.move_to_end(key)
+    return meaning
+
+
+def put(emoji: str, meaning: str) -> None:
+    """
+    Stores the meaning for an emoji, evicting the least recently used entry
+    once the cache is full.
+
+    Args:
+        emoji (str): The emoji character used as the cache key.
+        meaning (str): The explanation to cache.
+    """
+    key = _key(emoji)
+    _cache[key] = meaning
+    _cache.move_to_end(key)
+    while len(_cache) > _MAX_SIZE:
+        _cache.popitem(last=False)
+
+
+def inflight(emoji: str) -> Optional["asyncio.Future[str]"]:
+    """
+    Returns the future of an in-flight lookup for this emoji, if one exists.
+
+    Args:
+        emoji (str): The emoji character being looked up.
+
+    Returns:
+        Optional[asyncio.Future[str]]: The pending lookup, or None.
+    """
+    return _inflight.get(_key(emoji))
+
+
+def start_flight(emoji: str) -> "asyncio.Future[str]":
+    """
+    Registers a new in-flight lookup so concurrent misses on the same emoji
+    await this future instead of fanning out duplicate GROQ calls.
+
+    Args:
+        emoji (str): The emoji character being looked up.
+
+    Returns:
+        asyncio.Future[str]: The future the caller must resolve via finish_flight.
+    """
+    future: "asyncio.Future[str]" = asyncio.get_running_loop().create_future()
+    _inflight[_key(emoji)] = future
+    return future
+
+
+def finish_flight(
+    emoji: str,
+    future: "asyncio.Future[str]",
+    meaning: Optional[str] = None,
+    error: Optional[BaseException] = None,
+) -> None:
+    """
+    Resolves an in-flight lookup and removes it from the table.
+
+    Args:
+        emoji (str): The emoji character that was looked up.
+        future (asyncio.Future[str]): The future returned by start_flight.
+        meaning (Optional[str]): The meaning on success.
+        error (Optional[BaseException]): The failure, propagated to any waiters.
+    """
+    _inflight.pop(_key(emoji), None)
+    if error is not None:
+        future.set_exception(error)
+        # Mark the exception as retrieved so flights with no waiters do not
+        # emit "exception was never retrieved" warnings at GC time.
+        future.exception()
+    else:
+        future.set_result(meaning or "")
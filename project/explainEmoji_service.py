@@ -1,8 +1,10 @@
 from typing import Optional
 
-import httpx
 from pydantic import BaseModel
 
+import project.emoji_cache
+import project.http_client
+
 
 class EmojiExplainResponse(BaseModel):
     """
@@ -28,25 +30,31 @@ async def explainEmoji(emoji_character: str) -> EmojiExplainResponse:
         response.meaning
         > 'A yellow face with simple, open eyes and a broad, open smile.'
     """
-    emoji_api_url = "https://console.groq.com/api/emoji"
-    async with httpx.AsyncClient() as client:
+    cached_meaning = project.emoji_cache.get(emoji_character)
+    if cached_meaning is not None:
+        return EmojiExplainResponse(meaning=cached_meaning)
+    pending = project.emoji_cache.inflight(emoji_character)
+    if pending is not None:
         try:
-            response = await client.post(emoji_api_url, json={"emoji": emoji_character})
-            response.raise_for_status()
-            data = response.json()
-            if "meaning" in data:
-                return EmojiExplainResponse(meaning=data["meaning"])
-            else:
-                return EmojiExplainResponse(
-                    meaning="", error="Meaning not found for the provided emoji."
-                )
-        except httpx.HTTPStatusError:
-            return EmojiExplainResponse(
-                meaning="", error="Invalid response from the server."
-            )
-        except httpx.RequestError:
-            return EmojiExplainResponse(
-                meaning="", error="Failed to connect to the GROQ server."
-            )
-        except Exception as e:
-            return EmojiExplainResponse(meaning="", error=str(e))
+            return EmojiExplainResponse(meaning=await pending)
+        except Exception as exc:
+            return EmojiExplainResponse(meaning="", error=str(exc))
+    flight = project.emoji_cache.start_flight(emoji_character)
+    emoji_api_url = "https://console.groq.com/api/emoji"
+    data, error = await project.http_client.safe_json(
+        "POST", emoji_api_url, json={"emoji": emoji_character}
+    )
+    if error is not None:
+        project.emoji_cache.finish_flight(
+            emoji_character, flight, error=RuntimeError(error)
+        )
+        return EmojiExplainResponse(meaning="", error=error)
+    if "meaning" in data:
+        project.emoji_cache.put(emoji_character, data["meaning"])
+        project.emoji_cache.finish_flight(
+            emoji_character, flight, meaning=data["meaning"]
+        )
+        return EmojiExplainResponse(meaning=data["meaning"])
+    error = "Meaning not found for the provided emoji."
+    project.emoji_cache.finish_flight(emoji_character, flight, error=RuntimeError(error))
+    return EmojiExplainResponse(meaning="", error=error)
@@ -1,8 +1,10 @@
-import httpx
 import prisma
 import prisma.models
 from pydantic import BaseModel
 
+import project.emoji_cache
+import project.http_client
+
 
 class EmojiExplainerResponse(BaseModel):
     """
@@ -23,27 +25,31 @@ async def fetchEmojiMeaning(emoji: str) -> EmojiExplainerResponse:
     Returns:
         EmojiExplainerResponse: The response model that represents the explanation of the emoji obtained from the GROQ API. It encapsulates both the character and its meaning.
     """
+    cached_meaning = project.emoji_cache.get(emoji)
+    if cached_meaning is not None:
+        return EmojiExplainerResponse(emoji=emoji, explanation=cached_meaning)
     stored_emoji = await prisma.models.Emoji.prisma().find_unique(
         where={"character": emoji}
     )
     if stored_emoji:
+        project.emoji_cache.put(emoji, stored_emoji.meaning)
         return EmojiExplainerResponse(emoji=emoji, explanation=stored_emoji.meaning)
-    api_url = f"https://api.groq.com/emoji?char={emoji}"
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(api_url)
-            response.raise_for_status()
-            result_data = response.json()
-            meaning = result_data["explanation"]
-            new_emoji = await prisma.models.Emoji.prisma().create(
-                data={"character": emoji, "meaning": meaning}
-            )
-            return EmojiExplainerResponse(emoji=emoji, explanation=new_emoji.meaning)
-        except httpx.HTTPStatusError as e:
-            raise ValueError(
-                f"HTTP Error occurred: {e.response.status_code} - {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise ValueError(f"Network Error: {e.request.url} - {str(e)}")
-        except Exception as e:
-            raise ValueError(f"An error occurred: {str(e)}")
+    pending = project.emoji_cache.inflight(emoji)
+    if pending is not None:
+        return EmojiExplainerResponse(emoji=emoji, explanation=await pending)
+    flight = project.emoji_cache.start_flight(emoji)
+    try:
+        api_url = f"https://api.groq.com/emoji?char={emoji}"
+        result_data, error = await project.http_client.safe_json("GET", api_url)
+        if error is not None:
+            raise ValueError(error)
+        meaning = result_data["explanation"]
+        new_emoji = await prisma.models.Emoji.prisma().create(
+            data={"character": emoji, "meaning": meaning}
+        )
+    except BaseException as exc:
+        project.emoji_cache.finish_flight(emoji, flight, error=exc)
+        raise
+    project.emoji_cache.put(emoji, new_emoji.meaning)
+    project.emoji_cache.finish_flight(emoji, flight, meaning=new_emoji.meaning)
+    return EmojiExplainerResponse(emoji=emoji, explanation=new_emoji.meaning)
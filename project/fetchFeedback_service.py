@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 import prisma
 import prisma.models
@@ -19,40 +19,47 @@ class FeedbackDetail(BaseModel):
 
 class GetFeedbackResponse(BaseModel):
     """
-    This model represents the paginated response that includes user feedback details. The response includes pagination details to assist clients in navigating the data.
+    This model represents the paginated response that includes user feedback details. The nextCursor value is passed back by clients to fetch the following page.
     """
 
     feedbacks: List[FeedbackDetail]
-    totalPages: int
-    currentPage: int
+    nextCursor: Optional[int]
 
 
-async def fetchFeedback(page: int, limit: int) -> GetFeedbackResponse:
+async def fetchFeedback(limit: int = 20, cursor: Optional[int] = None) -> GetFeedbackResponse:
     """
-    This endpoint retrieves all feedback submitted by users. It is protected and periodically fetches data from the database to provide admins with a comprehensive view of user opinions and suggestions on emoji interpretations. The data is returned in a paginated format to manage large volumes of feedback.
+    This endpoint retrieves all feedback submitted by users. It is protected and periodically fetches data from the database to provide admins with a comprehensive view of user opinions and suggestions on emoji interpretations. The data is returned in pages navigated by keyset cursor, so deep pages cost the same as the first one.
 
     Args:
-    page (int): The page number of feedback results to be displayed.
     limit (int): The number of feedback entries to retrieve per page.
+    cursor (Optional[int]): The nextCursor value from the previous page, or None for the first page.
 
     Returns:
-    GetFeedbackResponse: This model represents the paginated response that includes user feedback details. The response includes pagination details to assist clients in navigating the data.
+    GetFeedbackResponse: This model represents the paginated response that includes user feedback details. The nextCursor value is passed back by clients to fetch the following page.
     """
-    skip = (page - 1) * limit
-    feedback_records = await prisma.models.Feedback.prisma().find_many(
-        skip=skip, take=limit, include={"user": True}, order={"createdAt": "desc"}
+    if cursor is not None:
+        feedback_records = await prisma.models.Feedback.prisma().find_many(
+            take=limit, cursor={"id": cursor}, skip=1, order={"id": "desc"}
+        )
+    else:
+        feedback_records = await prisma.models.Feedback.prisma().find_many(
+            take=limit, order={"id": "desc"}
+        )
+    next_cursor = (
+        feedback_records[-1].id if len(feedback_records) == limit else None
     )
-    total_feedback_count = await prisma.models.Feedback.prisma().count()
-    total_pages = (total_feedback_count + limit - 1) // limit
+    user_ids = list({record.userId for record in feedback_records})
+    users = await prisma.models.User.prisma().find_many(
+        where={"id": {"in": user_ids}}
+    )
+    emails_by_user_id = {user.id: user.email for user in users}
     feedback_details = [
-        FeedbackDetail(
+        FeedbackDetail.model_construct(
             id=record.id,
             content=record.content,
-            userEmail=record.user.email,
+            userEmail=emails_by_user_id[record.userId],
             createdAt=record.createdAt,
         )
         for record in feedback_records
     ]
-    return GetFeedbackResponse(
-        feedbacks=feedback_details, totalPages=total_pages, currentPage=page
-    )
+    return GetFeedbackResponse(feedbacks=feedback_details, nextCursor=next_cursor)
@@ -1,7 +1,6 @@
 from typing import List
 
 import prisma
-import prisma.models
 from pydantic import BaseModel
 
 
@@ -47,13 +46,11 @@ async def getHistory(request: HistoryRequest) -> HistoryResponse:
         > [{'emoji': '😀', 'meaning': 'grinning face'}, ...]
     """
     user_id = 1
-    feedbacks = await prisma.models.Feedback.prisma().find_many(
-        where={"userId": user_id},
-        include={"emoji": True},
-        order=[{"createdAt": "desc"}],
+    recent_emojis = await prisma.get_client().query_raw(
+        'SELECT e."character" AS emoji, e."meaning" AS meaning'
+        ' FROM "Feedback" f JOIN "Emoji" e ON e."id" = f."emojiId"'
+        ' WHERE f."userId" = $1 ORDER BY f."createdAt" DESC',
+        user_id,
+        model=EmojiDetails,
     )
-    recent_emojis = [
-        EmojiDetails(emoji=f.emoji.character, meaning=f.emoji.meaning)
-        for f in feedbacks
-    ]
     return HistoryResponse(recent_emojis=recent_emojis)
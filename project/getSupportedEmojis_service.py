@@ -1,7 +1,6 @@
 from typing import List
 
 import prisma
-import prisma.models
 from pydantic import BaseModel
 
 
@@ -42,8 +41,7 @@ async def getSupportedEmojis(
     Returns:
         GETSupportedEmojisResponse: The response model outputs a list of supported emojis. Each emoji in the list contains key characteristics like the symbol itself and its meaning.
     """
-    emojis_data = await prisma.models.Emoji.prisma().find_many()
-    emojis_list = [
-        Emoji(character=emoji.character, meaning=emoji.meaning) for emoji in emojis_data
-    ]
+    emojis_list = await prisma.get_client().query_raw(
+        'SELECT "character", "meaning" FROM "Emoji"', model=Emoji
+    )
     return GETSupportedEmojisResponse(emojis=emojis_list)
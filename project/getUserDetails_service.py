@@ -1,18 +1,21 @@
+import asyncio
 import datetime
 from enum import Enum
-from typing import Optional
 
 import prisma
+import prisma.errors
 import prisma.models
 from pydantic import BaseModel
 
 
-class Role(Enum):
+class Role(str, Enum):
     """
     Enum type defining possible roles: ADMIN, USER, GUEST.
     """
 
-    pass
+    ADMIN = "ADMIN"
+    USER = "USER"
+    GUEST = "GUEST"
 
 
 class UserDetailsResponse(BaseModel):
@@ -40,18 +43,21 @@ async def getUserDetails(userId: int) -> UserDetailsResponse:
         UserDetailsResponse: Provides detailed information of a user, excluding sensitive data like passwords.
                              Appropriate only for the user themselves or an admin.
     """
-    user: Optional[prisma.models.User] = await prisma.models.User.prisma().find_unique(
-        where={"id": userId}, include={"feedbacks": True, "sessions": True}
-    )
-    if user is None:
+    now = datetime.datetime.now(datetime.timezone.utc)
+    try:
+        user, feedbacks_count, active_sessions_count = await asyncio.gather(
+            prisma.models.User.prisma().find_unique_or_raise(where={"id": userId}),
+            prisma.models.Feedback.prisma().count(where={"userId": userId}),
+            prisma.models.Session.prisma().count(
+                where={"userId": userId, "expiresAt": {"gt": now}}
+            ),
+        )
+    except prisma.errors.RecordNotFoundError:
         raise ValueError("prisma.models.User not found.")
-    active_sessions_count = sum(
-        (1 for session in user.sessions if session.expiresAt > datetime.datetime.now())
-    )
     return UserDetailsResponse(
         id=user.id,
         email=user.email,
         role=user.role,
-        feedbacksCount=len(user.feedbacks),
+        feedbacksCount=feedbacks_count,
         sessionsCount=active_sessions_count,
     )
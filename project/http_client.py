@@ -0,0 +1,49 @@
+from typing import Any, Optional, Tuple
+
+import httpx
+import orjson
+
+client: httpx.AsyncClient = httpx.AsyncClient(
+    timeout=10.0,
+    http2=True,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+)
+"""Shared AsyncClient reused by every service that talks to GROQ.
+
+Creating a client per request pays a fresh DNS lookup plus TCP/TLS handshake
+on every outbound call; a single pooled client keeps connections alive across
+requests. The client is closed by the FastAPI lifespan in project.server.
+"""
+
+
+async def safe_json(
+    method: str, url: str, **kwargs: Any
+) -> Tuple[Optional[Any], Optional[str]]:
+    """
+    Performs a request on the shared client and decodes the JSON body,
+    mapping the usual httpx failure modes to an error string.
+
+    Args:
+        method (str): HTTP method, e.g. "GET" or "POST".
+        url (str): The URL to request.
+        **kwargs (Any): Extra arguments forwarded to httpx (json, headers, ...).
+
+    Returns:
+        Tuple[Optional[Any], Optional[str]]: (decoded body, None) on success,
+        (None, error message) on failure.
+    """
+    try:
+        response = await client.request(method, url, **kwargs)
+        response.raise_for_status()
+        return orjson.loads(response.content), None
+    except httpx.HTTPStatusError as e:
+        return None, f"HTTP Error occurred: {e.response.status_code} - {e.response.text}"
+    except httpx.RequestError as e:
+        return None, f"Network Error: {e.request.url} - {str(e)}"
+    except Exception as e:
+        return None, str(e)
+
+
+async def close() -> None:
+    """Closes the shared client. Called from the application lifespan on shutdown."""
+    await client.aclose()
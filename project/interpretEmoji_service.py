@@ -1,8 +1,10 @@
-import httpx
 import prisma
 import prisma.models
 from pydantic import BaseModel
 
+import project.emoji_cache
+import project.http_client
+
 
 class EmojiInterpretationResponse(BaseModel):
     """
@@ -22,23 +24,39 @@ async def interpretEmoji(emoji: str) -> EmojiInterpretationResponse:
     Returns:
     EmojiInterpretationResponse: Response model representing the interpreted meaning of the provided emoji character.
     """
-    async with httpx.AsyncClient() as client:
+    cached_meaning = project.emoji_cache.get(emoji)
+    if cached_meaning is not None:
+        return EmojiInterpretationResponse(meaning=cached_meaning)
+    pending = project.emoji_cache.inflight(emoji)
+    if pending is not None:
+        try:
+            return EmojiInterpretationResponse(meaning=await pending)
+        except Exception:
+            return EmojiInterpretationResponse(
+                meaning="Failed to interpret the emoji."
+            )
+    flight = project.emoji_cache.start_flight(emoji)
+    try:
         url = "https://console.groq.com/api/interpret"
         headers = {"Content-Type": "application/json"}
         body = {"emoji": emoji}
-        response = await client.post(url, headers=headers, json=body)
-        if response.status_code == 200:
-            data = response.json()
-            meaning = data.get("meaning", "No interpretation found.")
-            try:
-                emoji_entry = await prisma.models.Emoji.prisma().create(
-                    data={"character": emoji, "meaning": meaning}
-                )
-            except Exception as e:
-                emoji_entry = await prisma.models.Emoji.prisma().find_unique(
-                    where={"character": emoji}
-                )
-                meaning = emoji_entry.meaning if emoji_entry else meaning
-            return EmojiInterpretationResponse(meaning=meaning)
-        else:
-            return EmojiInterpretationResponse(meaning="Failed to interpret the emoji.")
+        data, error = await project.http_client.safe_json(
+            "POST", url, headers=headers, json=body
+        )
+        if error is not None:
+            project.emoji_cache.finish_flight(emoji, flight, error=RuntimeError(error))
+            return EmojiInterpretationResponse(
+                meaning="Failed to interpret the emoji."
+            )
+        meaning = data.get("meaning", "No interpretation found.")
+        emoji_entry = await prisma.models.Emoji.prisma().upsert(
+            where={"character": emoji},
+            data={"create": {"character": emoji, "meaning": meaning}, "update": {}},
+        )
+        meaning = emoji_entry.meaning
+    except BaseException as exc:
+        project.emoji_cache.finish_flight(emoji, flight, error=exc)
+        raise
+    project.emoji_cache.put(emoji, meaning)
+    project.emoji_cache.finish_flight(emoji, flight, meaning=meaning)
+    return EmojiInterpretationResponse(meaning=meaning)
@@ -1,8 +1,15 @@
+# Every route handler in this module must be `async def` and must await its
+# service call: the services all perform I/O (Prisma or the shared httpx
+# client), and a sync `def` handler would be dispatched to the threadpool while
+# an unawaited call would return a bare coroutine. Only a handler doing zero
+# I/O should ever be written as plain `def`.
+import hashlib
 import logging
 from contextlib import asynccontextmanager
 
 import project.checkApiStatus_service
 import project.createUser_service
+import project.db
 import project.deleteFeedback_service
 import project.deleteUser_service
 import project.explainEmoji_service
@@ -11,35 +18,62 @@ import project.fetchFeedback_service
 import project.getHistory_service
 import project.getSupportedEmojis_service
 import project.getUserDetails_service
+import project.http_client
 import project.interpretEmoji_service
 import project.submitFeedback_service
 import project.updateFeedback_service
 import project.updateUser_service
 import project.userLogin_service
-from fastapi import FastAPI
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import Response
-from prisma import Prisma
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse, Response
 
 logger = logging.getLogger(__name__)
 
-db_client = Prisma(auto_register=True)
+
+def _etag_response(http_request: Request, payload: bytes) -> Response:
+    """
+    Builds a JSON response carrying a weak content hash as its ETag, or an
+    empty 304 when the client's If-None-Match already matches.
+    """
+    etag = hashlib.blake2b(payload, digest_size=8).hexdigest()
+    if http_request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(
+        content=payload,
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    await db_client.connect()
+    await project.db.db.connect()
+    await project.db.warmup()
+    status_probe = project.checkApiStatus_service.start_probe()
     yield
-    await db_client.disconnect()
+    status_probe.cancel()
+    await project.http_client.close()
+    await project.db.db.disconnect()
 
 
 app = FastAPI(
     title="emoji-explainer",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     description="create an endpoint that connects to groq https://console.groq.com and takes in an emoji as input and explains to the user the meaning of it",
 )
 
 
+@app.exception_handler(Exception)
+async def handle_unexpected_error(request: Request, exc: Exception) -> ORJSONResponse:
+    """
+    Converts any unhandled service exception into the 500 JSON body the
+    per-handler try/except blocks used to build.
+    """
+    logger.exception("Error processing request")
+    return ORJSONResponse({"error": str(exc)}, status_code=500)
+
+
 @app.put(
     "/api/users/{userId}", response_model=project.updateUser_service.UpdateUserResponse
 )
@@ -49,41 +83,21 @@ async def api_put_updateUser(
     """
     Updates user details for a specific userId. Accepts fields like email, name, and role in the JSON body. Requires user authentication and only allows the user or an admin to update the data. Returns the updated user information.
     """
-    try:
-        res = await project.updateUser_service.updateUser(userId, email, name, role)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    return await project.updateUser_service.updateUser(userId, email, name, role)
 
 
 @app.get(
     "/api/status", response_model=project.checkApiStatus_service.GetApiStatusResponse
 )
 async def api_get_checkApiStatus(
+    http_request: Request,
     request: project.checkApiStatus_service.GetApiStatusRequest,
 ) -> project.checkApiStatus_service.GetApiStatusResponse | Response:
     """
     This endpoint provides the current status of the emoji-explainer API. It helps in monitoring whether the API is up and running and can connect to external services like GROQ. The endpoint would simply return a status code and a message indicating the API's health.
     """
-    try:
-        res = await project.checkApiStatus_service.checkApiStatus(request)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    res = await project.checkApiStatus_service.checkApiStatus(request)
+    return _etag_response(http_request, res.model_dump_json().encode())
 
 
 @app.post(
@@ -95,39 +109,17 @@ async def api_post_explainEmoji(
     """
     This POST endpoint receives an emoji as input from the user, sends a request to the GROQ platform to retrieve the explanation and meaning of the provided emoji. The endpoint integrates with the GROQ API, crafting a query based on the received emoji and parsing the GROQ response to format a user-friendly explanation. Expected responses include a success case with the emoji's meaning or a fail case with an error message (e.g., unsupported emoji). This route is essential to allow real-time emoji explanations to users across various devices, owing to the Responsive Design Module's capability to adapt the response format according to the device.
     """
-    try:
-        res = await project.explainEmoji_service.explainEmoji(emoji_character)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    return await project.explainEmoji_service.explainEmoji(emoji_character)
 
 
 @app.get("/feedback", response_model=project.fetchFeedback_service.GetFeedbackResponse)
 async def api_get_fetchFeedback(
-    page: int, limit: int
+    limit: int = 20, cursor: int | None = None
 ) -> project.fetchFeedback_service.GetFeedbackResponse | Response:
     """
-    This endpoint retrieves all feedback submitted by users. It is protected and periodically fetches data from the database to provide admins with a comprehensive view of user opinions and suggestions on emoji interpretations. The data is returned in a paginated format to manage large volumes of feedback effectively.
+    This endpoint retrieves all feedback submitted by users. It is protected and periodically fetches data from the database to provide admins with a comprehensive view of user opinions and suggestions on emoji interpretations. The data is returned in pages navigated by the nextCursor value from the previous response.
     """
-    try:
-        res = await project.fetchFeedback_service.fetchFeedback(page, limit)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    return await project.fetchFeedback_service.fetchFeedback(limit, cursor)
 
 
 @app.patch(
@@ -140,20 +132,9 @@ async def api_patch_updateFeedback(
     """
     Allows administrators to update existing feedback entries. Users may need to correct or add additional information to their feedback. This endpoint provides flexibility in maintaining accurate and useful data, with access restricted to higher privilege roles to prevent unauthorized modifications.
     """
-    try:
-        res = project.updateFeedback_service.updateFeedback(
-            feedbackId, newContent, userId
-        )
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    return await project.updateFeedback_service.updateFeedback(
+        feedbackId, newContent, userId
+    )
 
 
 @app.delete(
@@ -165,18 +146,7 @@ async def api_delete_deleteUser(
     """
     Deletes a user account for a specified userId. This is a protected route that requires authentication and is only permissible for admin role users. Returns a success message with status code 200 if deletion is successful.
     """
-    try:
-        res = await project.deleteUser_service.deleteUser(userId)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    return await project.deleteUser_service.deleteUser(userId)
 
 
 @app.post(
@@ -188,20 +158,9 @@ async def api_post_submitFeedback(
     """
     This endpoint allows users to submit feedback on emoji interpretations. It accepts JSON data containing the emoji and the user's feedback. This data is then sent to the API Communication Module for processing and storage. The endpoint ensures that feedback is collected efficiently and securely, with appropriate validation in place.
     """
-    try:
-        res = await project.submitFeedback_service.submitFeedback(
-            userId, emojiId, content
-        )
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    return await project.submitFeedback_service.submitFeedback(
+        userId, emojiId, content
+    )
 
 
 @app.post(
@@ -214,18 +173,7 @@ async def api_post_fetchEmojiMeaning(
     """
     This endpoint allows users to input an emoji and request its meaning from the GROQ API. The route expects an emoji character as input, sends a query to the GROQ API, and returns the explanation of the emoji. It's essential to handle errors gracefully, such as invalid emoji inputs or issues with GROQ API communication.
     """
-    try:
-        res = await project.fetchEmojiMeaning_service.fetchEmojiMeaning(emoji)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    return await project.fetchEmojiMeaning_service.fetchEmojiMeaning(emoji)
 
 
 @app.get(
@@ -233,23 +181,14 @@ async def api_post_fetchEmojiMeaning(
     response_model=project.getSupportedEmojis_service.GETSupportedEmojisResponse,
 )
 async def api_get_getSupportedEmojis(
+    http_request: Request,
     request: project.getSupportedEmojis_service.GETSupportedEmojisRequest,
 ) -> project.getSupportedEmojis_service.GETSupportedEmojisResponse | Response:
     """
     This GET endpoint provides a list of all emojis that can be interpreted by the system. It queries an internal database through the API Communication Module to retrieve the supported emoji list, ensuring that it is always up-to-date. This endpoint is primarily informational and is used to enhance user experience by informing them of the supported functionalities.
     """
-    try:
-        res = await project.getSupportedEmojis_service.getSupportedEmojis(request)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    res = await project.getSupportedEmojis_service.getSupportedEmojis(request)
+    return _etag_response(http_request, res.model_dump_json().encode())
 
 
 @app.post(
@@ -262,18 +201,7 @@ async def api_post_interpretEmoji(
     """
     This endpoint receives a JSON payload containing an emoji character and sends a request to the Groq API to fetch the interpretation of the emoji. It processes the emoji input, forwards it to the Groq service, and parses the response to provide a meaningful interpretation. The endpoint expects a payload of {'emoji': 'emoji_character'} and returns a JSON object {'meaning': 'explanation_text'}. This service is crucial for delivering the core functionality of the emoji-explainer product.
     """
-    try:
-        res = await project.interpretEmoji_service.interpretEmoji(emoji)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    return await project.interpretEmoji_service.interpretEmoji(emoji)
 
 
 @app.delete(
@@ -286,18 +214,7 @@ async def api_delete_deleteFeedback(
     """
     This endpoint allows administrators to delete specific feedback entries. It requires a feedback ID as a path parameter. This function ensures that administrators can manage content within the database responsibly, maintaining the integrity and relevance of the feedback data stored.
     """
-    try:
-        res = await project.deleteFeedback_service.deleteFeedback(feedbackId)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    return await project.deleteFeedback_service.deleteFeedback(feedbackId)
 
 
 @app.get("/api/history", response_model=project.getHistory_service.HistoryResponse)
@@ -307,18 +224,7 @@ async def api_get_getHistory(
     """
     Fetches a list of recently interpreted emojis along with their meanings from the database. This endpoint provides history tracking and retrieval functionality, enhancing user experience by allowing them to view past interpretations. It returns a JSON array of recent interpretations, e.g., [{'emoji': 'emoji_character', 'meaning': 'interpretation_text'}]. This service is intended for use by logged-in users to view their personal emoji interpretation history.
     """
-    try:
-        res = await project.getHistory_service.getHistory(request)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    return await project.getHistory_service.getHistory(request)
 
 
 @app.get(
@@ -331,18 +237,7 @@ async def api_get_getUserDetails(
     """
     Retrieves detailed information of a user based on the supplied userID in the URL path. Only authenticated and authorized users can access this information. It ensures data safety by allowing only the user or admins to fetch the details.
     """
-    try:
-        res = await project.getUserDetails_service.getUserDetails(userId)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    return await project.getUserDetails_service.getUserDetails(userId)
 
 
 @app.post("/api/users/login", response_model=project.userLogin_service.LoginResponse)
@@ -352,18 +247,7 @@ async def api_post_userLogin(
     """
     This endpoint allows users to log in. It requires an email and password in the request body. If authentication is successful, it returns a JSON Web Token (JWT) for session management, along with user details.
     """
-    try:
-        res = await project.userLogin_service.userLogin(email, password)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    return await project.userLogin_service.userLogin(email, password)
 
 
 @app.post("/api/users", response_model=project.createUser_service.CreateUserResponse)
@@ -373,15 +257,4 @@ async def api_post_createUser(
     """
     This endpoint creates a new user account. It expects a JSON body with user details such as email, password, and role. It returns the created user's details excluding the password, and upon successful creation, returns a status code of 201.
     """
-    try:
-        res = await project.createUser_service.createUser(email, password, role)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    return await project.createUser_service.createUser(email, password, role)
@@ -1,4 +1,5 @@
 import prisma
+import prisma.errors
 import prisma.models
 from pydantic import BaseModel
 
@@ -26,18 +27,15 @@ async def submitFeedback(
     Returns:
     FeedbackResponseModel: Response model confirming the receipt and handling of the user feedback.
     """
-    user = await prisma.models.User.prisma().find_unique(where={"id": userId})
-    if not user:
-        return FeedbackResponseModel(success=False, message="User not found")
-    emoji = await prisma.models.Emoji.prisma().find_unique(where={"id": emojiId})
-    if not emoji:
-        return FeedbackResponseModel(success=False, message="Emoji not found")
-    feedback = await prisma.models.Feedback.prisma().create(
-        data={"userId": userId, "emojiId": emojiId, "content": content}
-    )
-    if feedback:
-        return FeedbackResponseModel(
-            success=True, message="Feedback received successfully"
+    try:
+        await prisma.models.Feedback.prisma().create(
+            data={"userId": userId, "emojiId": emojiId, "content": content}
         )
-    else:
+    except prisma.errors.ForeignKeyViolationError as e:
+        constraint = str(e.meta or "")
+        if "userId" in constraint:
+            return FeedbackResponseModel(success=False, message="User not found")
+        if "emojiId" in constraint:
+            return FeedbackResponseModel(success=False, message="Emoji not found")
         return FeedbackResponseModel(success=False, message="Failed to submit feedback")
+    return FeedbackResponseModel(success=True, message="Feedback received successfully")
@@ -0,0 +1,43 @@
+import prisma
+import prisma.models
+from pydantic import BaseModel
+
+
+class PatchFeedbackResponse(BaseModel):
+    """
+    This model confirms the outcome of a feedback update, indicating whether the entry was changed and the reason otherwise.
+    """
+
+    success: bool
+    message: str
+    feedbackId: int
+
+
+async def updateFeedback(
+    feedbackId: int, newContent: str, userId: int
+) -> PatchFeedbackResponse:
+    """
+    Allows administrators to update existing feedback entries. Users may need to correct or add additional information to their feedback. This endpoint provides flexibility in maintaining accurate and useful data, with access restricted to higher privilege roles to prevent unauthorized modifications.
+
+    Args:
+        feedbackId (int): The unique identifier of the feedback entry to update.
+        newContent (str): The corrected feedback text.
+        userId (int): ID of the user the feedback belongs to.
+
+    Returns:
+        PatchFeedbackResponse: This model confirms the outcome of a feedback update, indicating whether the entry was changed and the reason otherwise.
+    """
+    updated_count = await prisma.models.Feedback.prisma().update_many(
+        where={"id": feedbackId, "userId": userId}, data={"content": newContent}
+    )
+    if updated_count:
+        return PatchFeedbackResponse(
+            success=True,
+            message=f"Feedback {feedbackId} updated successfully.",
+            feedbackId=feedbackId,
+        )
+    return PatchFeedbackResponse(
+        success=False,
+        message=f"No feedback found with ID {feedbackId} for user {userId}",
+        feedbackId=feedbackId,
+    )
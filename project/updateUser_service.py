@@ -1,16 +1,19 @@
 from enum import Enum
 
 import prisma
+import prisma.errors
 import prisma.models
 from pydantic import BaseModel
 
 
-class Role(Enum):
+class Role(str, Enum):
     """
     Enum type defining possible roles: ADMIN, USER, GUEST.
     """
 
-    pass
+    ADMIN = "ADMIN"
+    USER = "USER"
+    GUEST = "GUEST"
 
 
 class UpdateUserResponse(BaseModel):
@@ -47,17 +50,18 @@ async def updateUser(
         updateUser(1, "newemail@example.com", "John Doe", Role.USER)
         > UpdateUserResponse(userId=1, email="newemail@example.com", name="John Doe", role="USER")
     """
-    existing_user = await prisma.models.User.prisma().find_unique(where={"id": userId})
-    if not existing_user:
+    try:
+        updated_user = await prisma.models.User.prisma().update(
+            where={"id": userId},
+            data={"email": email, "name": name, "role": role},
+        )
+    except prisma.errors.RecordNotFoundError:
         raise ValueError("User with ID does not exist")
-    updated_user = await prisma.models.User.prisma().update(
-        where={"id": userId}, data={"email": email, "name": name, "role": role.value}
-    )
     return UpdateUserResponse(
         userId=updated_user.id,
         email=updated_user.email,
         name=updated_user.name,
-        role=updated_user.role.value,
+        role=updated_user.role,
     )  # TODO(autogpt): Cannot access attribute "name" for class "User"
 
 